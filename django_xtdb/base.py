@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import sys
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 from django.db import connections
 from django.db.backends.base import features
 from django.db.backends.base.introspection import TableInfo
 from django.db.backends.postgresql import base, creation, introspection, operations, schema
+from django.db.models.sql.constants import GET_ITERATOR_CHUNK_SIZE
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator, Sequence
@@ -102,19 +104,28 @@ class DatabaseFeatures(features.BaseDatabaseFeatures):
         "Tests that break later tests": {"datetimes.tests.DateTimesTests.test_21432"},
         "XTDB does not support order by RANDOM()": {"ordering.tests.OrderingTests.test_random_ordering"},
     }
+    # These are kept for the lifetime of the process, so intern the test names
+    django_test_skips = {reason: {sys.intern(test) for test in tests} for reason, tests in django_test_skips.items()}
 
 
 class DatabaseIntrospection(introspection.DatabaseIntrospection):
     def get_table_list(self, cursor: CursorWrapper) -> list[TableInfo]:  # type: ignore[override]
-        cursor.cursor.connection.connection.read_only = True
-        with cursor.cursor.connection.connection.transaction():
+        with self.connection.xtdb_transaction(read_only=True):  # type: ignore[attr-defined]
             cursor.execute("SELECT tablename FROM pg_tables where schemaname = 'public'")
-            return [TableInfo(row[0], "t") for row in cursor.fetchall()]
+            tables: list[TableInfo] = []
+            while rows := cursor.fetchmany(GET_ITERATOR_CHUNK_SIZE):
+                tables.extend(TableInfo(row[0], "t") for row in rows)
+            return tables
 
 
 class DatabaseOperations(operations.DatabaseOperations):
     compiler_module = "django_xtdb.compiler"
 
+    date_trunc_prefixes = {
+        lookup_type: f"DATE_TRUNC({lookup_type.upper()}, "
+        for lookup_type in ("year", "quarter", "month", "week", "day", "hour", "minute", "second")
+    }
+
     def adapt_ipaddressfield_value(self, value: str | None) -> str | None:
         return value
 
@@ -124,16 +135,14 @@ class DatabaseOperations(operations.DatabaseOperations):
     def sql_flush(
         self, style: Style, tables: Sequence[str], *, reset_sequences: bool = False, allow_cascade: bool = False
     ) -> list[str]:
-        return [
-            "{} {} {};".format(
-                style.SQL_KEYWORD("DELETE"), style.SQL_KEYWORD("FROM"), style.SQL_FIELD(self.quote_name(table))
-            )
-            for table in tables
-        ]
+        prefix = f"{style.SQL_KEYWORD('DELETE')} {style.SQL_KEYWORD('FROM')}"
+        return [f"{prefix} {style.SQL_FIELD(self.quote_name(table))};" for table in tables]
 
     def execute_sql_flush(self, sql_list: Iterable[str]) -> None:
-        self.connection.connection.read_only = False
-        with self.connection.connection.transaction(), self.connection.cursor() as cursor:
+        with (
+            self.connection.xtdb_transaction(read_only=False),  # type: ignore[attr-defined]
+            self.connection.cursor() as cursor,
+        ):
             for sql in sql_list:
                 cursor.execute(sql)
 
@@ -146,12 +155,16 @@ class DatabaseOperations(operations.DatabaseOperations):
         return lookup
 
     def date_trunc_sql(self, lookup_type: str, sql: str, params: Any, tzname: str | None = None) -> tuple[str, Any]:
-        sql, params = self._convert_sql_to_tz(sql, params, tzname)  # type: ignore[attr-defined]
-        return f"DATE_TRUNC({lookup_type.upper()}, {sql})", (*params,)
+        if tzname is not None:
+            sql, params = self._convert_sql_to_tz(sql, params, tzname)  # type: ignore[attr-defined]
+        prefix = self.date_trunc_prefixes.get(lookup_type) or f"DATE_TRUNC({lookup_type.upper()}, "
+        return prefix + sql + ")", params if isinstance(params, tuple) else (*params,)
 
     def datetime_trunc_sql(self, lookup_type: str, sql: str, params: Any, tzname: str | None) -> str:
-        sql, params = self._convert_sql_to_tz(sql, params, tzname)  # type: ignore[attr-defined]
-        return f"DATE_TRUNC({lookup_type.upper()}, {sql})"
+        if tzname is not None:
+            sql, params = self._convert_sql_to_tz(sql, params, tzname)  # type: ignore[attr-defined]
+        prefix = self.date_trunc_prefixes.get(lookup_type) or f"DATE_TRUNC({lookup_type.upper()}, "
+        return prefix + sql + ")"
 
 
 class DatabaseSchemaEditor(schema.DatabaseSchemaEditor):
@@ -195,18 +208,62 @@ class DatabaseWrapper(base.DatabaseWrapper):
     introspection_class = DatabaseIntrospection
     ops_class = DatabaseOperations
 
-    def ensure_timezone(self) -> bool:
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # The access mode that was last set on the psycopg connection
+        self._xtdb_mode: Literal["ro", "rw"] | None = None
+
+    @staticmethod
+    def ensure_timezone() -> bool:
         return False
 
-    def _configure_connection(self, connection: Any) -> bool:
+    @staticmethod
+    def _configure_connection(connection: Any) -> bool:  # noqa: ARG004
         return False
 
-    def check_constraints(self, table_names: list[str] | None = None) -> None:
+    @staticmethod
+    def check_constraints(table_names: list[str] | None = None) -> None:
         pass
 
     def create_cursor(self, name: str | None = None) -> Any:
         return self.connection.cursor()
 
+    def connect(self) -> None:
+        self._xtdb_mode = None
+        super().connect()
+
+    def close(self) -> None:
+        super().close()
+        self._xtdb_mode = None
+
+    def xtdb_set_read_only(self, read_only: bool) -> None:
+        """
+        Set the access mode for the next transaction on the psycopg connection.
+
+        The mode is only changed when it differs from the mode used by the
+        previous transaction.
+        """
+        mode: Literal["ro", "rw"] = "ro" if read_only else "rw"
+        if self._xtdb_mode != mode:
+            self.connection.read_only = read_only
+            self._xtdb_mode = mode
+
+    @contextmanager
+    def xtdb_transaction(self, read_only: bool) -> Iterator[None]:
+        """
+        Run a statement in a transaction with the given access mode.
+
+        XTDB needs to know up front whether a transaction is read-only or
+        read-write.
+        """
+        if self.connection is None:
+            yield
+            return
+
+        self.xtdb_set_read_only(read_only)
+        with self.connection.transaction():
+            yield
+
     @contextmanager
     def _nodb_cursor(self) -> Iterator[Any]:
         """
@@ -217,9 +274,9 @@ class DatabaseWrapper(base.DatabaseWrapper):
         """
         for connection in connections.all():
             if connection.vendor == "xtdb":
-                conn = self.__class__(
-                    {**self.settings_dict, "NAME": connection.settings_dict["NAME"]}, alias=self.alias
-                )
+                settings_dict = self.settings_dict.copy()
+                settings_dict["NAME"] = connection.settings_dict["NAME"]
+                conn = self.__class__(settings_dict, alias=self.alias)
                 try:
                     with conn.cursor() as cursor:
                         yield cursor
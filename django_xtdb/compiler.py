@@ -21,35 +21,19 @@ class SQLCompiler(BaseSQLCompiler):
         return super().as_sql(with_limits, with_col_aliases=True)
 
     def execute_sql(self, *args: Any, **kwargs: Any) -> Any:
-        if self.connection.connection:
-            self.connection.connection.read_only = True
-            with self.connection.connection.transaction():
-                ret = super().execute_sql(*args, **kwargs)
-        else:
-            ret = super().execute_sql(*args, **kwargs)
-
-        return ret
+        with self.connection.xtdb_transaction(read_only=True):  # type: ignore[attr-defined]
+            return super().execute_sql(*args, **kwargs)
 
 
 class SQLInsertCompiler(BaseSQLInsertCompiler):
     def execute_sql(self, *args: Any, **kwargs: Any) -> list[tuple[Any]]:  # type: ignore[override]
-        if self.connection.connection:
-            self.connection.connection.read_only = False
-            with self.connection.connection.transaction():
-                ret = super().execute_sql(*args, **kwargs)
-        else:
-            ret = super().execute_sql(*args, **kwargs)
-
-        return ret
+        with self.connection.xtdb_transaction(read_only=False):  # type: ignore[attr-defined]
+            return super().execute_sql(*args, **kwargs)
 
 
 class SQLUpdateCompiler(BaseSQLUpdateCompiler):
     def execute_sql(self, *args: Any, **kwargs: Any) -> int:  # type: ignore[override]
-        if self.connection.connection:
-            self.connection.connection.read_only = False
-            with self.connection.connection.transaction():
-                super().execute_sql(*args, **kwargs)
-        else:
+        with self.connection.xtdb_transaction(read_only=False):  # type: ignore[attr-defined]
             super().execute_sql(*args, **kwargs)
 
         # XTDB currently does not return changed row counts so we fake that
@@ -59,11 +43,5 @@ class SQLUpdateCompiler(BaseSQLUpdateCompiler):
 
 class SQLDeleteCompiler(BaseSQLDeleteCompiler):
     def execute_sql(self, *args: Any, **kwargs: Any) -> Any:
-        if self.connection.connection:
-            self.connection.connection.read_only = False
-            with self.connection.connection.transaction():
-                ret = super().execute_sql(*args, **kwargs)
-        else:
-            ret = super().execute_sql(*args, **kwargs)
-
-        return ret
+        with self.connection.xtdb_transaction(read_only=False):  # type: ignore[attr-defined]
+            return super().execute_sql(*args, **kwargs)
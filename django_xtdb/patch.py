@@ -1,29 +1,59 @@
 from __future__ import annotations
 
+import functools
 import time
 from typing import TYPE_CHECKING, Any
 
 from django.conf import settings
+from django.core.signals import setting_changed
 from django.db import router
-from django.db.models.fields import NOT_PROVIDED, AutoField, Field
+from django.db.models.fields import NOT_PROVIDED, AutoFieldMixin, Field
+from django.dispatch import receiver
 
 if TYPE_CHECKING:
     from django.db.models import Model
 
+# Direct reference to the original method, set by monkey_patch(), so the
+# patched version can call it without looking it up through the MRO of every
+# field. It is only declared here, so reloading this module keeps the value.
+orig_contribute_to_class: Any
+
+
+@functools.cache
+def xtdb_databases() -> tuple[int, int]:
+    """Return the number of configured databases and how many of those use XTDB."""
+    engines = [database.get("ENGINE") for database in settings.DATABASES.values()]
+    return len(engines), engines.count("django_xtdb")
+
+
+@receiver(setting_changed)
+def clear_xtdb_databases(*, setting: str, **kwargs: Any) -> None:  # noqa: ARG001
+    if setting == "DATABASES":
+        xtdb_databases.cache_clear()
+
 
 def is_xtdb_model(cls: type[Model]) -> bool:
-    db = router.db_for_write(cls)
-    if settings.DATABASES[db]["ENGINE"] == "django_xtdb":
-        return True
-    else:
+    total, xtdb = xtdb_databases()
+    # Only ask the routers when there is an actual choice between XTDB and
+    # other databases.
+    if xtdb == 0:
         return False
+    if xtdb == total:
+        return True
+
+    db = router.db_for_write(cls)
+    return bool(settings.DATABASES[db]["ENGINE"] == "django_xtdb")
 
 
 def contribute_to_class(self: Any, cls: type[Model], name: str, private_only: bool = False) -> None:
-    if self.primary_key and is_xtdb_model(cls):
+    is_parent_link = bool(self.remote_field and self.remote_field.parent_link)
+    is_xtdb = (self.primary_key or is_parent_link) and is_xtdb_model(cls)
+
+    if self.primary_key and is_xtdb:
         # XTDB always requires an _id column with the primary key of the row.
         self.db_column = "_id"
-        if self.default is NOT_PROVIDED and isinstance(self, AutoField):
+        is_auto_field = isinstance(self, AutoFieldMixin)
+        if self.default is NOT_PROVIDED and is_auto_field:
             # XTDB does not support server side IDs and Django AutoField that is
             # used for the primary key field relies on this. Normally you insert
             # a row without the primary key and get the primary key back from
@@ -45,12 +75,20 @@ def contribute_to_class(self: Any, cls: type[Model], name: str, private_only: bo
             # and we have to set this to False.
             self.db_returning = False
 
-    if self.remote_field and self.remote_field.parent_link and is_xtdb_model(cls):
+    if is_parent_link and is_xtdb:
         self.db_column = "_id"
 
-    self.orig_contribute_to_class(cls, name, private_only)
+    orig_contribute_to_class(self, cls, name, private_only)
 
 
 def monkey_patch() -> None:
-    Field.orig_contribute_to_class = Field.contribute_to_class  # type: ignore[attr-defined]
+    global orig_contribute_to_class  # noqa: PLW0603
+
+    # The marker is kept on Field, so it also survives reloading this module
+    # and other libraries wrapping contribute_to_class after us.
+    if getattr(Field, "_xtdb_patched", False):
+        return
+
+    orig_contribute_to_class = Field.contribute_to_class
     Field.contribute_to_class = contribute_to_class  # type: ignore[method-assign]
+    Field._xtdb_patched = True  # type: ignore[attr-defined]  # noqa: SLF001